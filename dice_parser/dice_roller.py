@@ -1,20 +1,54 @@
+import typing
+from functools import lru_cache
 from random import randrange
 
 from dice_parser.modifier import DiceModifier
 
+if typing.TYPE_CHECKING:
+    from numpy.random import Generator
+
+_NUMPY_MAX_SIZE = 2 ** 63 - 1
+
+
+@lru_cache(maxsize=None)
+def _numpy_rng() -> 'Generator | None':
+    try:
+        from numpy.random import default_rng
+    except ImportError:
+        return None
+
+    return default_rng()
+
 
 class DiceRoller:
+    BATCH_THRESHOLD = 8
+
     def __init__(self, count: int, size: int, modifier: DiceModifier) -> None:
         self._count: int = count
         self._size: int = size
         self._modifier: DiceModifier = modifier
 
     def roll(self) -> tuple[int, list[int]]:
-        rolled = [self._roll_die(self._size) for _ in range(self._count)]
+        rolled = self._roll_dice()
         actual, ignored = self._modifier.get_actual_dice(rolled)
 
         return sum(actual), rolled
 
+    def _roll_dice(self) -> list[int]:
+        if self._count >= self.BATCH_THRESHOLD:
+            return self._roll_batch(self._count, self._size)
+
+        return [self._roll_die(self._size) for _ in range(self._count)]
+
+    def _roll_batch(self, count: int, size: int) -> list[int]:
+        # NumPy has its own generator: random.seed() does not affect these rolls
+        rng = _numpy_rng() if 0 < size < _NUMPY_MAX_SIZE else None
+        if rng is None:
+            return [self._roll_die(size) for _ in range(count)]
+
+        rolled: list[int] = rng.integers(1, 1 + size, size=count).tolist()
+        return rolled
+
     @classmethod
     def _roll_die(cls, size: int) -> int:
         return randrange(1, 1 + size) if size > 0 else 0
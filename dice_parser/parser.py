@@ -1,4 +1,8 @@
-from lark import Lark
+from functools import lru_cache
+from typing import Any, ClassVar
+
+from lark import Lark, Token, Tree
+from lark.exceptions import VisitError
 
 from dice_parser.parser_result import InternalParseResult, ParseResult
 from dice_parser.transformer import DiceTransformer
@@ -21,7 +25,7 @@ class DiceParser:
             | product "/" dice  -> div
         
         ?dice: atom
-            | dice_count? ("d" | "D") dice_size? dice_modifier? -> roll
+            | [atom] ("d" | "D") [atom] [dice_modifier] -> roll
 
         ?atom: NUMBER          -> number
             | "-" atom         -> neg
@@ -31,20 +35,48 @@ class DiceParser:
         ?dice_modifier: ("h" | "H") atom -> dice_highest
             | ("l" | "L") atom           -> dice_lowest
 
-        dice_count: atom -> dice_count
-        dice_size: atom -> dice_size
-        
         %import common.WS_INLINE
         %ignore WS_INLINE
     """
 
-    def __init__(self) -> None:
-        self._parser = Lark(self.GRAMMAR, parser='lalr', transformer=DiceTransformer())
+    GRAMMAR_CACHE: ClassVar[bool | str] = False
 
-    def parse(self, string: str) -> ParseResult:
-        result = self._parser.parse(string)
-        assert isinstance(result, InternalParseResult)
+    _PARSER_CORES: ClassVar[dict[str, Lark]] = {}
 
-        return result.to_public_result()
+    @classmethod
+    def _get_parser(cls) -> Lark:
+        parser = cls._PARSER_CORES.get(cls.GRAMMAR)
+        if parser is None:
+            parser = cls._PARSER_CORES[cls.GRAMMAR] = Lark(
+                cls.GRAMMAR,
+                parser='lalr',
+                maybe_placeholders=True,
+                cache=cls.GRAMMAR_CACHE,
+                **cls._parser_plugins(),
+            )
+
+        return parser
 
+    @classmethod
+    def _parser_plugins(cls) -> dict[str, Any]:
+        try:
+            import lark_cython  # type: ignore[import-untyped]
+        except ImportError:
+            return {}
 
+        return {'_plugins': lark_cython.plugins}
+
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _parse_tree(cls, string: str) -> Tree[Token]:
+        return cls._get_parser().parse(string, start='start')
+
+    def parse(self, string: str, vars: dict[str, int] | None = None) -> ParseResult:
+        tree = self._parse_tree(string)
+        try:
+            result = DiceTransformer(vars).transform(tree)
+        except VisitError as e:
+            raise e.orig_exc from None
+        assert isinstance(result, InternalParseResult)
+
+        return result.to_public_result()
@@ -1,114 +1,97 @@
-import operator
+from typing import ClassVar, cast
 
-from lark import Transformer, v_args
+from lark import Token, Transformer, v_args
 
 from dice_parser.dice_roller import DiceRoller
-from dice_parser.modifier import DiceModifier
+from dice_parser.modifier import DiceModifier, HighestDiceModifier, LowestDiceModifier, NullDiceModifier
 from dice_parser.parser_result import InternalParseResult
 
 
-class NullDiceModifier(DiceModifier):
-    def get_actual_dice(self, dice: list[int]) -> tuple[list[int], list[int]]:
-        return dice, []
+class DiceTransformer(Transformer[Token, InternalParseResult]):
+    # Results are never mutated after creation, so literals can be shared
+    _NUMBER_CACHE: ClassVar[dict[str, InternalParseResult]] = {}
+    _NUMBER_CACHE_LIMIT: ClassVar[int] = 256
 
+    def __init__(self, vars: dict[str, int] | None = None) -> None:
+        super().__init__(visit_tokens=False)
+        self.vars: dict[str, int] = vars if vars is not None else {}
 
-class HighestDiceModifier(DiceModifier):
-    def get_actual_dice(self, dice: list[int]) -> tuple[list[int], list[int]]:
-        sorted_dice = sorted(dice)
-        count = self._safe_count(dice)
-        n = len(sorted_dice)
+    def add(self, children: list[InternalParseResult]) -> InternalParseResult:
+        a, b = children
+        return InternalParseResult(cast(int, a.value) + cast(int, b.value), f'{a.string} + {b.string}')
 
-        return sorted_dice[n - count:], sorted_dice[:n - count]
+    def sub(self, children: list[InternalParseResult]) -> InternalParseResult:
+        a, b = children
+        return InternalParseResult(cast(int, a.value) - cast(int, b.value), f'{a.string} - {b.string}')
 
+    def mul(self, children: list[InternalParseResult]) -> InternalParseResult:
+        a, b = children
+        return InternalParseResult(cast(int, a.value) * cast(int, b.value), f'{a.string} * {b.string}')
 
-class LowestDiceModifier(DiceModifier):
-    def get_actual_dice(self, dice: list[int]) -> tuple[list[int], list[int]]:
-        sorted_dice = sorted(dice)
-        count = self._safe_count(dice)
+    def div(self, children: list[InternalParseResult]) -> InternalParseResult:
+        a, b = children
+        return InternalParseResult(cast(int, a.value) // cast(int, b.value), f'{a.string} / {b.string}')
 
-        return sorted_dice[:count], sorted_dice[count:]
+    def neg(self, children: list[InternalParseResult]) -> InternalParseResult:
+        (a,) = children
+        return InternalParseResult(-cast(int, a.value), f'-{a.string}')
 
+    def number(self, children: list[Token]) -> InternalParseResult:
+        (token,) = children
+        cached = self._NUMBER_CACHE.get(token.value)
+        if cached is not None:
+            return cached
 
-class DiceTransformer(Transformer[InternalParseResult, int]):
-    def __init__(self) -> None:
-        super().__init__()
-        self.vars: dict[str, InternalParseResult] = {}
+        value = int(token.value)
+        result = InternalParseResult(value, str(value))
+        if value < self._NUMBER_CACHE_LIMIT and token.value == result.string:
+            self._NUMBER_CACHE[token.value] = result
 
-    add = InternalParseResult.operator(operator.add, '{} + {}')
-    sub = InternalParseResult.operator(operator.sub, '{} - {}')
-    mul = InternalParseResult.operator(operator.mul, '{} * {}')
-    div = InternalParseResult.operator(operator.floordiv, '{} / {}')
-    neg = InternalParseResult.operator(operator.neg, '-{}')
-
-    @v_args(inline=True)
-    def number(self, value: str) -> InternalParseResult:
-        return InternalParseResult(int(value), str(int(value)), None)
-
-    @v_args(inline=True)
-    def dice_count(self, result: InternalParseResult) -> InternalParseResult:
-        return self._add_flag(result, 'dice_count')
-
-    @v_args(inline=True)
-    def dice_size(self, result: InternalParseResult) -> InternalParseResult:
-        assert isinstance(result.value, int)
-        if result.value < 1:
-            result.value = 0
-        return self._add_flag(result, 'dice_size')
+        return result
 
     @v_args(inline=True)
     def dice_highest(self, result: InternalParseResult) -> InternalParseResult:
-        assert isinstance(result.value, int)
-        return InternalParseResult(HighestDiceModifier(int(result.value)), None, 'dice_modifier')
+        return InternalParseResult(HighestDiceModifier(cast(int, result.value)), None)
 
     @v_args(inline=True)
     def dice_lowest(self, result: InternalParseResult) -> InternalParseResult:
-        assert isinstance(result.value, int)
-        return InternalParseResult(LowestDiceModifier(int(result.value)), None, 'dice_modifier')
+        return InternalParseResult(LowestDiceModifier(cast(int, result.value)), None)
 
-    @v_args(inline=True)
-    def brackets(self, result: InternalParseResult) -> InternalParseResult:
-        return InternalParseResult(result.value, '({})'.format(result.string))
+    def brackets(self, children: list[InternalParseResult]) -> InternalParseResult:
+        (result,) = children
+        return InternalParseResult(result.value, f'({result.string})')
 
     @v_args(inline=True)
-    def roll(self, *args: InternalParseResult) -> InternalParseResult:
-        count = 1
-        size = 20
-        modifier: DiceModifier = NullDiceModifier()
-        for arg in args:
-            if arg.flag == 'dice_count':
-                assert isinstance(arg.value, int)
-                count = arg.value
-            if arg.flag == 'dice_size':
-                assert isinstance(arg.value, int)
-                size = arg.value
-            if arg.flag == 'dice_modifier':
-                assert isinstance(arg.value, DiceModifier)
-                modifier = arg.value
+    def roll(
+        self,
+        count_arg: InternalParseResult | None,
+        size_arg: InternalParseResult | None,
+        modifier_arg: InternalParseResult | None,
+    ) -> InternalParseResult:
+        count = cast(int, count_arg.value) if count_arg is not None else 1
+        size = cast(int, size_arg.value) if size_arg is not None else 20
+        if size < 1:
+            size = 0
+        modifier = cast(DiceModifier, modifier_arg.value) if modifier_arg is not None else NullDiceModifier()
 
         roller = DiceRoller(count, size, modifier)
         rolled_result, rolled_dice = roller.roll()
 
         return InternalParseResult(
             rolled_result,
-            '[{}]'.format(', '.join(str(d) for d in rolled_dice)),
+            str(rolled_dice),
         )
 
     @v_args(inline=True)
-    def assign_var(self, name: str, result: InternalParseResult) -> InternalParseResult:
-        self.vars[name] = InternalParseResult(
-            result.value,
-            name,
-        )
+    def assign_var(self, token: Token, result: InternalParseResult) -> InternalParseResult:
+        name = token.value
+        self.vars[name] = cast(int, result.value)
 
         return InternalParseResult(
             result.value,
-            '{} = {}'.format(name, result.string),
+            f'{name} = {result.string}',
         )
 
-    @v_args(inline=True)
-    def var(self, name: str) -> InternalParseResult:
-        return self.vars[name]
-
-    @classmethod
-    def _add_flag(cls, result: InternalParseResult, flag: str) -> InternalParseResult:
-        return InternalParseResult(result.value, result.string, flag)
+    def var(self, children: list[Token]) -> InternalParseResult:
+        (token,) = children
+        return InternalParseResult(self.vars[token.value], token.value)
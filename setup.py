@@ -5,6 +5,7 @@ setup(
     version='1.0',
     packages=['dice_parser'],
     install_requires=['lark>=1.1.9'],
+    extras_require={'cython': ['lark-cython'], 'numpy': ['numpy']},
     url='https://github.com/VadimPushtaev/dice_parser',
     license='MIT',
     author='Vadim Pushtaev',
@@ -1,12 +1,15 @@
+from dataclasses import FrozenInstanceError
 from unittest import TestCase
 
 from dice_parser.dice_roller import DiceRoller
 from dice_parser.parser import DiceParser
+from dice_parser.transformer import DiceTransformer
 
 
 class DiceExpressionTestCase(TestCase):
     def setUp(self):
         self.parser = DiceParser()
+        self.addCleanup(setattr, DiceRoller, '_roll_die', DiceRoller.__dict__['_roll_die'])
         DiceRoller._roll_die = lambda cls_, size: size
 
     def test_simple(self):
@@ -14,6 +17,31 @@ class DiceExpressionTestCase(TestCase):
         self.assertEqual(17, result.value)
         self.assertEqual('3 * 4 + 12 / 3 + (3 - 2)', result.string)
 
+    def test_negative(self):
+        result = self.parser.parse('-3 * -(7 - 2) / 2')
+        self.assertEqual(7, result.value)
+        self.assertEqual('-3 * -(7 - 2) / 2', result.string)
+
+    def test_result_is_frozen(self):
+        result = self.parser.parse('1 + 2')
+        with self.assertRaises(FrozenInstanceError):
+            result.value = 4
+        self.assertEqual(hash(result), hash(self.parser.parse('1 + 2')))
+
+    def test_number_cache__canonical_only(self):
+        for i in range(2, 300):
+            self.assertEqual(0, self.parser.parse('0' * i).value)
+        self.assertEqual('7', self.parser.parse('007').string)
+        self.assertEqual(7, self.parser.parse('7').value)
+
+        self.assertNotIn('007', DiceTransformer._NUMBER_CACHE)
+        self.assertIn('7', DiceTransformer._NUMBER_CACHE)
+        self.assertLessEqual(len(DiceTransformer._NUMBER_CACHE), DiceTransformer._NUMBER_CACHE_LIMIT)
+
+    def test_division_by_zero(self):
+        with self.assertRaises(ZeroDivisionError):
+            self.parser.parse('1/0')
+
     def test_dice(self):
         result = self.parser.parse('d10 * 3 + 2D + ( 3 D 30 )')
         self.assertEqual(160, result.value)
@@ -61,11 +89,51 @@ class DiceExpressionTestCase(TestCase):
         self.assertEqual(self.parser.parse('3d10L(-1)').value, 0)
 
     def test_vars(self):
-        result = self.parser.parse('a=2+2')
+        variables = {}
+        result = self.parser.parse('a=2+2', variables)
         self.assertEqual(4, result.value)
         self.assertEqual('a = 2 + 2', result.string)
 
-        result = self.parser.parse('d a')
+        result = self.parser.parse('d a', variables)
         self.assertEqual(4, result.value)
         self.assertEqual('[4]', result.string)
+        self.assertEqual({'a': 4}, variables)
+
+    def test_vars__passed_in(self):
+        result = self.parser.parse('d20 + mod', {'mod': 3})
+        self.assertEqual(23, result.value)
+        self.assertEqual('[20] + mod', result.string)
+
+    def test_parser_core_is_shared(self):
+        other = DiceParser()
+        self.assertIs(self.parser._get_parser(), other._get_parser())
+
+    def test_parser_core_per_grammar(self):
+        class MulParser(DiceParser):
+            GRAMMAR = DiceParser.GRAMMAR.replace('-> add', '-> mul')
+
+        self.parser.parse('2+3')
+        self.assertIsNot(MulParser._get_parser(), DiceParser._get_parser())
+        result = MulParser().parse('2+3')
+        self.assertEqual(6, result.value)
+        self.assertEqual('2 * 3', result.string)
+        self.assertEqual(5, self.parser.parse('2+3').value)
+
+    def test_parse_tree_cache_rerolls(self):
+        rolled = iter([3, 5])
+        DiceRoller._roll_die = lambda cls_, size: next(rolled)
+
+        self.assertEqual('[3] + 1', self.parser.parse('d6+1').string)
+        self.assertEqual('[5] + 1', self.parser.parse('d6+1').string)
+        self.assertIs(self.parser._parse_tree('d6+1'), self.parser._parse_tree('d6+1'))
+
+    def test_vars__not_mutated_by_dice_size(self):
+        variables = {}
+        self.parser.parse('a=0-1', variables)
+        self.assertEqual('[0, 0]', self.parser.parse('2d a', variables).string)
+        self.assertEqual(-1, self.parser.parse('a', variables).value)
 
+    def test_vars__scoped_to_call(self):
+        self.parser.parse('a=2')
+        with self.assertRaises(KeyError):
+            self.parser.parse('a')
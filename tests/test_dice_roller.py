@@ -1,6 +1,7 @@
 from unittest import TestCase
 
-from dice_parser.modifier import DiceModifier
+from dice_parser.dice_roller import DiceRoller
+from dice_parser.modifier import DiceModifier, HighestDiceModifier, LowestDiceModifier, NullDiceModifier
 
 
 class SomeDiceModifier(DiceModifier):
@@ -9,10 +10,47 @@ class SomeDiceModifier(DiceModifier):
 
 
 class DiceRollerTestCase(TestCase):
+    def setUp(self):
+        self.addCleanup(setattr, DiceRoller, '_roll_die', DiceRoller.__dict__['_roll_die'])
+        self.addCleanup(setattr, DiceRoller, '_roll_batch', DiceRoller.__dict__['_roll_batch'])
+
     def test__safe_count(self):
         self.assertEqual(SomeDiceModifier(-3)._safe_count([1, 2]), 0)
         self.assertEqual(SomeDiceModifier(0)._safe_count([1, 2]), 0)
         self.assertEqual(SomeDiceModifier(2)._safe_count([1, 2]), 2)
         self.assertEqual(SomeDiceModifier(5)._safe_count([1, 2]), 2)
 
+    def test_highest_modifier(self):
+        dice = [3, 6, 1, 6, 2, 4]
+        for count in range(-1, 8):
+            actual, ignored = HighestDiceModifier(count).get_actual_dice(dice)
+            kept = max(0, min(count, len(dice)))
+            self.assertEqual(sorted(actual), sorted(dice)[len(dice) - kept:])
+            self.assertEqual(sorted(ignored), sorted(dice)[:len(dice) - kept])
+
+    def test_lowest_modifier(self):
+        dice = [3, 6, 1, 6, 2, 4]
+        for count in range(-1, 8):
+            actual, ignored = LowestDiceModifier(count).get_actual_dice(dice)
+            kept = max(0, min(count, len(dice)))
+            self.assertEqual(sorted(actual), sorted(dice)[:kept])
+            self.assertEqual(sorted(ignored), sorted(dice)[kept:])
+
+    def test_roll__large_pool(self):
+        total, rolled = DiceRoller(40, 6, NullDiceModifier()).roll()
+        self.assertEqual(len(rolled), 40)
+        self.assertTrue(all(type(d) is int and 1 <= d <= 6 for d in rolled))
+        self.assertEqual(total, sum(rolled))
+
+    def test_roll__batch_hook(self):
+        DiceRoller._roll_die = lambda cls_, size: 1
+        DiceRoller._roll_batch = lambda self_, count, size: [size] * count
+
+        self.assertEqual(DiceRoller(7, 6, NullDiceModifier()).roll(), (7, [1] * 7))
+        self.assertEqual(DiceRoller(8, 6, NullDiceModifier()).roll(), (48, [6] * 8))
 
+    def test_roll__large_pool_int64_bound(self):
+        for size in [2 ** 63 - 2, 2 ** 63 - 1, 10 ** 20]:
+            total, rolled = DiceRoller(8, size, NullDiceModifier()).roll()
+            self.assertEqual(len(rolled), 8)
+            self.assertTrue(all(1 <= d <= size for d in rolled))